@@ -2,26 +2,79 @@ from __future__ import annotations
 
 import math
 import random
-from typing import Optional, Tuple, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 import color
 import exceptions
 
 if TYPE_CHECKING:
     from engine import Engine
-    from entity import Actor, Entity, Item
+    from entity import Actor, Item
 
 def compute_damage(attack_power, defense, crit_chance=0.05, crit_mult=1.5):
-    is_crit = False
     damage = attack_power - defense
     if random.random() <= crit_chance:
-        is_crit = True
-        damage *= crit_mult
+        # Only a crit can turn integer stats into a fractional value.
+        damage = math.ceil(damage * crit_mult)
         if damage <= 0:
             damage = 1
-    return math.ceil(damage), is_crit
+        return damage, True
+    return damage, False
+
+def _log_attack(
+    engine: Engine, attack_desc: str, damage: int, is_crit: bool, attack_color: Tuple[int, int, int]
+) -> None:
+    """Log the outcome of an attack, e.g. `attack_desc` = "Orc attacks player"."""
+    if is_crit:
+        attack_color = color.crit_atk
+    if damage > 0:
+        crit_text = " [CRIT!]" if is_crit else ""
+        engine.message_log.add_message(
+            f"{attack_desc} for {damage} hit points{crit_text}.", attack_color
+        )
+    else:
+        engine.message_log.add_message(
+            f"{attack_desc} but does no damage.", attack_color
+        )
+
+def _try_move(entity: Actor, dx: int, dy: int) -> bool:
+    """Move `entity` by (dx, dy) if the destination is free.
+    Returns False instead of raising, for callers that expect to be blocked.
+    """
+    dest_x, dest_y = entity.x + dx, entity.y + dy
+    game_map = entity.gamemap
+
+    if not game_map.in_bounds(dest_x, dest_y):
+        # Destination is out of bounds.
+        return False
+    if not game_map.walkable[dest_x, dest_y]:
+        # Destination is blocked by a tile.
+        return False
+    if game_map.get_blocking_entity_at_location(dest_x, dest_y):
+        # Destination is blocked by an entity.
+        return False
+
+    entity.move(dx, dy)
+    return True
+
+def _melee(entity: Actor, target: Actor) -> None:
+    """Have `entity` attack the adjacent `target` once."""
+    engine = entity.gamemap.engine
+    damage, is_crit = compute_damage(entity.fighter.power, target.fighter.defense, entity.fighter.crit_chance)
+    if entity is engine.player:
+        attack_color = color.player_atk
+    else:
+        attack_color = color.enemy_atk
+    _log_attack(
+        engine, f"{entity.display_name} attacks {target.name}", damage, is_crit, attack_color
+    )
+    if damage > 0:
+        target.fighter.hp -= damage
 
 class Action:
+    # Actions are created for every move and attack; slots keep them small.
+    __slots__ = ("entity",)
+
     def __init__(self, entity: Actor) -> None:
         super().__init__()
         self.entity = entity
@@ -43,6 +96,8 @@ class Action:
 class PickupAction(Action):
     """Pickup an item and add it to the inventory, if there is room for it."""
 
+    __slots__ = ()
+
     def __init__(self, entity: Actor):
         super().__init__(entity)
 
@@ -50,23 +105,25 @@ class PickupAction(Action):
         actor_location_x = self.entity.x
         actor_location_y = self.entity.y
         inventory = self.entity.inventory
+        engine = self.engine
+        game_map = engine.game_map
 
-        for item in self.engine.game_map.items:
-            if actor_location_x == item.x and actor_location_y == item.y:
-                if len(inventory.items) >= inventory.capacity:
-                    raise exceptions.Impossible("Your inventory is full.")
+        item = next(game_map.get_items_at_location(actor_location_x, actor_location_y), None)
+        if item is None:
+            raise exceptions.Impossible("There is nothing here to pick up.")
+        if len(inventory.items) >= inventory.capacity:
+            raise exceptions.Impossible("Your inventory is full.")
 
-                self.engine.game_map.entities.remove(item)
-                item.parent = self.entity.inventory
-                inventory.items.append(item)
+        game_map.remove_entity(item)
+        item.parent = inventory
+        inventory.items.append(item)
 
-                self.engine.message_log.add_message(f"You picked up the {item.name}!")
-                return
-
-        raise exceptions.Impossible("There is nothing here to pick up.")
+        engine.message_log.add_message(f"You picked up the {item.name}!")
 
 
 class ItemAction(Action):
+    __slots__ = ("item", "target_xy")
+
     def __init__(
         self, entity: Actor, item: Item, target_xy: Optional[Tuple[int, int]] = None
     ):
@@ -87,6 +144,8 @@ class ItemAction(Action):
             self.item.consumable.activate(self)
 
 class DropItem(ItemAction):
+    __slots__ = ()
+
     def perform(self) -> None:
         if self.entity.equipment.item_is_equipped(self.item):
             self.entity.equipment.toggle_equip(self.item)
@@ -94,6 +153,8 @@ class DropItem(ItemAction):
         self.entity.inventory.drop(self.item)
 
 class EquipAction(Action):
+    __slots__ = ("item",)
+
     def __init__(self, entity: Actor, item: Item):
         super().__init__(entity)
 
@@ -104,152 +165,129 @@ class EquipAction(Action):
 
 
 class WaitAction(Action):
+    __slots__ = ()
+
     def perform(self) -> None:
         pass
 
 class TakeStairsAction(Action):
+    __slots__ = ()
+
     def perform(self) -> None:
         """
         Take the stairs, if any exist at the entity's location.
         """
-        if (self.entity.x, self.entity.y) == self.engine.game_map.downstairs_location:
-            self.engine.game_world.generate_floor()
-            self.engine.message_log.add_message(
+        engine = self.engine
+        stairs_x, stairs_y = engine.game_map.downstairs_location
+        if self.entity.x == stairs_x and self.entity.y == stairs_y:
+            engine.game_world.generate_floor()
+            engine.message_log.add_message(
                 "You descend the staircase.", color.descend
             )
         else:
             raise exceptions.Impossible("There are no stairs here.")
 
 class ActionWithDirection(Action):
+    __slots__ = ("dx", "dy")
+
     def __init__(self, entity: Actor, dx: int, dy: int):
         super().__init__(entity)
 
         self.dx = dx
         self.dy = dy
 
-    @property
-    def dest_xy(self) -> Tuple[int, int]:
-        """Returns this actions destination."""
-        return self.entity.x + self.dx, self.entity.y + self.dy
-
-    @property
-    def blocking_entity(self) -> Optional[Entity]:
-        """Return the blocking entity at this actions destination.."""
-        return self.engine.game_map.get_blocking_entity_at_location(*self.dest_xy)
-
-    @property
-    def target_actor(self) -> Optional[Actor]:
-        """Return the actor at this actions destination."""
-        return self.engine.game_map.get_actor_at_location(*self.dest_xy)
-
     def perform(self) -> None:
         raise NotImplementedError()
 
 
 class MeleeAction(ActionWithDirection):
+    __slots__ = ()
+
     def perform(self) -> None:
-        target = self.target_actor
+        entity = self.entity
+        target = entity.gamemap.get_actor_at_location(entity.x + self.dx, entity.y + self.dy)
         if not target:
             raise exceptions.Impossible("Nothing to attack.")
-
-        if self.entity.name == "Dragon" or self.entity.name == "Ender Dragon" or self.entity.name == "Hydra":
-            crit_chance = 0.3
-        else:
-            crit_chance = 0.05
-        damage, is_crit = compute_damage(self.entity.fighter.power, target.fighter.defense, crit_chance)
-        attack_desc = f"{self.entity.name.capitalize()} attacks {target.name}"
-        crit_text = ""
-        if self.entity is self.engine.player:
-            attack_color = color.player_atk
-        else:
-            attack_color = color.enemy_atk
-        if is_crit:
-            attack_color = color.crit_atk
-            crit_text = " [CRIT!]"
-        if damage > 0:
-            self.engine.message_log.add_message(
-                f"{attack_desc} for {damage} hit points{crit_text}.", attack_color
-            )
-            target.fighter.hp -= damage
-        else:
-            self.engine.message_log.add_message(
-                f"{attack_desc} but does no damage.", attack_color
-            )
+        _melee(entity, target)
 
 class RangedAttackAction(ActionWithDirection):
+    __slots__ = ()
+
     def perform(self) -> None:
-        target = self.engine.player
+        engine = self.engine
+        target = engine.player
         damage, is_crit = compute_damage(self.entity.fighter.power, target.fighter.defense)
-
-        attack_desc = f"{self.entity.name.capitalize()} zaps {target.name}"
-        crit_text = ""
-        attack_color = color.enemy_atk
-        if is_crit:
-            attack_color = color.crit_atk
-            crit_text = " [CRIT!]"
-
+        _log_attack(
+            engine, f"{self.entity.display_name} zaps {target.name}", damage, is_crit, color.enemy_atk
+        )
         if damage > 0:
-            self.engine.message_log.add_message(
-                f"{attack_desc} for {damage} hit points.{crit_text}", attack_color
-            )
             target.fighter.hp -= damage
-        else:
-            self.engine.message_log.add_message(
-                f"{attack_desc} but does no damage.", attack_color
-            )
 
 
 class MovementAction(ActionWithDirection):
-    def perform(self) -> None:
-        dest_x, dest_y = self.dest_xy
+    __slots__ = ()
 
-        if not self.engine.game_map.in_bounds(dest_x, dest_y):
-            # Destination is out of bounds.
-            raise exceptions.Impossible("That way is blocked.")
-        if not self.engine.game_map.tiles["walkable"][dest_x, dest_y]:
-            # Destination is blocked by a tile.
-            raise exceptions.Impossible("That way is blocked.")
-        if self.engine.game_map.get_blocking_entity_at_location(dest_x, dest_y):
-            # Destination is blocked by an entity.
+    def perform(self) -> None:
+        if not _try_move(self.entity, self.dx, self.dy):
             raise exceptions.Impossible("That way is blocked.")
 
-        self.entity.move(self.dx, self.dy)
-
 
 class BumpAction(ActionWithDirection):
-    def perform(self) -> None:
-        if self.target_actor:
-            return MeleeAction(self.entity, self.dx, self.dy).perform()
+    __slots__ = ()
 
-        else:
-            return MovementAction(self.entity, self.dx, self.dy).perform()
+    def perform(self) -> None:
+        entity = self.entity
+        dest_x, dest_y = entity.x + self.dx, entity.y + self.dy
+        # Use the shared helpers rather than building a MeleeAction or
+        # MovementAction, and hand over the target already looked up.
+        target = entity.gamemap.get_actor_at_location(dest_x, dest_y)
+        if target:
+            _melee(entity, target)
+        elif not _try_move(entity, self.dx, self.dy):
+            raise exceptions.Impossible("That way is blocked.")
 
 class MovementRepeatedAction(MovementAction):
+    __slots__ = ()
+
     def perform(self):
         # First, check if any monsters are visible (in which case do NOT move).
         if self.engine.game_map.any_monsters_visible():
             return None
 
-        try:
-            super().perform()
+        # Running into an obstacle is the normal way for this to end, so
+        # avoid the cost of raising and catching Impossible for it.
+        if _try_move(self.entity, self.dx, self.dy):
             return True
-        except exceptions.Impossible:
-            return None
+        return None
 
 class TargetMovementAction(Action):
+    __slots__ = ("x", "y", "path", "path_index")
+
     def __init__(self, entity: Actor, x: int, y: int):
         super().__init__(entity)
         self.x = x
         self.y = y
-        self.path = self.entity.get_path_to(x, y)
+        # Computed on the first step rather than when the action is created.
+        self.path: Optional[List[Tuple[int, int]]] = None
+        # Index of the next step in `path`; cheaper than popping from the front.
+        self.path_index = 0
 
     def perform(self):
-        if not self.path:
+        # Like MovementRepeatedAction, stop once a monster comes into view.
+        # The first step is always taken, so the player can still travel
+        # away from a monster that is already visible.
+        if self.path is not None and self.engine.game_map.any_monsters_visible():
+            return False
+        if self.path is None:
+            self.path = self.entity.get_path_to(self.x, self.y)
+        if self.path_index >= len(self.path):
             # Nothing to do.
             return False
-        x, y = self.path.pop(0)
-        if self.engine.game_map.get_blocking_entity_at_location(x, y):
+        x, y = self.path[self.path_index]
+        self.path_index += 1
+        entity = self.entity
+        if entity.gamemap.get_blocking_entity_at_location(x, y):
             # If path becomes blocked, abort further motion.
             return False
-        self.entity.move(x - self.entity.x, y - self.entity.y)
+        entity.move(x - entity.x, y - entity.y)
         return True  # keep going
@@ -11,8 +11,35 @@ from actions import Action, BumpAction, MeleeAction, MovementAction, WaitAction,
 if TYPE_CHECKING:
     from entity import Actor
 
+# The eight directions an actor can step in, built once rather than per turn.
+DIRECTIONS = (
+    (-1, -1),  # Northwest
+    (0, -1),  # North
+    (1, -1),  # Northeast
+    (-1, 0),  # West
+    (1, 0),  # East
+    (-1, 1),  # Southwest
+    (0, 1),  # South
+    (1, 1),  # Southeast
+)
+
+# Message (and its color) logged when one of these monsters first notices the player.
+SPOTTED_MESSAGES = {
+    "Dragon": ("You have been spotted by a dragon!", color.dragon_roar),
+    "Ender Dragon": ("You have been spotted by an ender dragon!", color.dragon_roar_end),
+    "Hydra": ("You have been spotted by a hydra!", color.hydra_roar),
+}
+
+# Monsters that attack from further away than the adjacent tiles.
+ATTACKS = {
+    "Wizard": (RangedAttackAction, 3),
+    "Crawler": (MeleeAction, 2),
+}
+
 
 class BaseAI(Action):
+    __slots__ = ()
+
     def perform(self) -> None:
         raise NotImplementedError()
 
@@ -23,6 +50,8 @@ class ConfusedEnemy(BaseAI):
     If an actor occupies a tile it is randomly moving into, it will attack.
     """
 
+    __slots__ = ("previous_ai", "turns_remaining", "bump")
+
     def __init__(
         self, entity: Actor, previous_ai: Optional[BaseAI], turns_remaining: int
     ):
@@ -30,6 +59,8 @@ class ConfusedEnemy(BaseAI):
 
         self.previous_ai = previous_ai
         self.turns_remaining = turns_remaining
+        # Reused every turn; a BumpAction keeps no state between performs.
+        self.bump = BumpAction(entity, 0, 0)
 
     def perform(self) -> None:
         # Revert the AI back to the original state if the effect has run its course.
@@ -40,68 +71,53 @@ class ConfusedEnemy(BaseAI):
             self.entity.ai = self.previous_ai
         else:
             # Pick a random direction
-            direction_x, direction_y = random.choice(
-                [
-                    (-1, -1),  # Northwest
-                    (0, -1),  # North
-                    (1, -1),  # Northeast
-                    (-1, 0),  # West
-                    (1, 0),  # East
-                    (-1, 1),  # Southwest
-                    (0, 1),  # South
-                    (1, 1),  # Southeast
-                ]
-            )
+            bump = self.bump
+            bump.dx, bump.dy = random.choice(DIRECTIONS)
 
             self.turns_remaining -= 1
 
             # The actor will either try to move or attack in the chosen random direction.
             # Its possible the actor will just bump into the wall, wasting a turn.
-            return BumpAction(self.entity, direction_x, direction_y,).perform()
+            return bump.perform()
 
 class HostileEnemy(BaseAI):
+    __slots__ = ("path", "spotted_message", "attack_cls", "attack_range")
+
     def __init__(self, entity: Actor):
         super().__init__(entity)
         self.path: List[Tuple[int, int]] = []
+        # Resolved once here; the name does not change while the AI is active.
+        self.spotted_message = SPOTTED_MESSAGES.get(entity.name)
+        # How this monster attacks, and from how far (Chebyshev distance).
+        self.attack_cls, self.attack_range = ATTACKS.get(entity.name, (MeleeAction, 1))
 
     def perform(self) -> None:
-        target = self.engine.player
-        dx = target.x - self.entity.x
-        dy = target.y - self.entity.y
-        distance = max(abs(dx), abs(dy))  # Chebyshev distance.
+        engine = self.engine
+        entity = self.entity
+        target = engine.player
+        x, y = entity.x, entity.y
+
+        if engine.game_map.visible[x, y]:
+            # Only needed once the player is in view, which most monsters
+            # are not on most turns.
+            dx = target.x - x
+            dy = target.y - y
+            distance = max(abs(dx), abs(dy))  # Chebyshev distance.
 
-        if self.engine.game_map.visible[self.entity.x, self.entity.y]:
             # Give actor chance to notice player, if that has not happened yet.
-            if not self.entity.noticed_player:
-                self.entity.noticed_player = True
-                if self.entity.name == "Dragon":
-                    Dragon_message = "You have been spotted by a dragon!"
-                    Dragon_message_color = color.dragon_roar
-                    self.engine.message_log.add_message(Dragon_message, Dragon_message_color)
-                if self.entity.name == "Ender Dragon":
-                    Dragon_message = "You have been spotted by an ender dragon!"
-                    Dragon_message_color = color.dragon_roar_end
-                    self.engine.message_log.add_message(Dragon_message, Dragon_message_color)
-                if self.entity.name == "Hydra":
-                    Dragon_message = "You have been spotted by a hydra!"
-                    Dragon_message_color = color.hydra_roar
-                    self.engine.message_log.add_message(Dragon_message, Dragon_message_color)
-            if self.entity.name == "Wizard":
-                if distance <= 3:
-                    return RangedAttackAction(self.entity, dx, dy).perform()
-            if self.entity.name == "Crawler":
-                if distance <= 2:
-                    return MeleeAction(self.entity, dx, dy).perform()
-
-            if distance <= 1:
-                return MeleeAction(self.entity, dx, dy).perform()
-
-            self.path = self.entity.get_path_to(target.x, target.y)
+            if not entity.noticed_player:
+                entity.noticed_player = True
+                if self.spotted_message is not None:
+                    engine.message_log.add_message(*self.spotted_message)
+            if distance <= self.attack_range:
+                return self.attack_cls(entity, dx, dy).perform()
+
+            self.path = entity.get_path_to(target.x, target.y)
 
         if self.path:
             dest_x, dest_y = self.path.pop(0)
             return MovementAction(
-                self.entity, dest_x - self.entity.x, dest_y - self.entity.y,
+                entity, dest_x - x, dest_y - y,
             ).perform()
 
-        return WaitAction(self.entity).perform()
+        return WaitAction(entity).perform()
@@ -9,6 +9,9 @@ if TYPE_CHECKING:
 
 
 class BaseComponent:
+    # Empty, so subclasses that declare __slots__ really drop their __dict__.
+    __slots__ = ()
+
     parent: Entity  # Owning entity instance.
 
     @property
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import random
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Tuple, TYPE_CHECKING
+
+import numpy as np  # type: ignore
+
 import actions
 import color
 import components.ai
-from components.effect import RageEffect
+from components.effect import RageEffect, TimedEffect
 import components.inventory
 from components.base_component import BaseComponent
 from exceptions import Impossible
@@ -20,6 +23,8 @@ if TYPE_CHECKING:
 
 
 class Consumable(BaseComponent):
+    __slots__ = ("parent",)
+
     parent: Item
 
     def get_action(self, consumer: Actor) -> Optional[ActionOrHandler]:
@@ -32,6 +37,20 @@ class Consumable(BaseComponent):
         """
         raise NotImplementedError()
 
+    def _apply_effect(
+        self,
+        consumer: Actor,
+        effect: TimedEffect,
+        message: str,
+        message_color: Tuple[int, int, int] = color.status_effect_applied,
+    ) -> None:
+        """Attach `effect` to `consumer`, log `message`, start the effect and use up this item."""
+        consumer.effects.append(effect)
+        effect.parent = consumer
+        self.engine.message_log.add_message(message, message_color)
+        effect.activate()
+        self.consume()
+
     def consume(self) -> None:
         """Remove the consumed item from its containing inventory."""
         entity = self.parent
@@ -41,6 +60,8 @@ class Consumable(BaseComponent):
 
 
 class ConfusionConsumable(Consumable):
+    __slots__ = ("number_of_turns",)
+
     def __init__(self, number_of_turns: int):
         self.number_of_turns = number_of_turns
 
@@ -75,6 +96,8 @@ class ConfusionConsumable(Consumable):
 
 
 class HealingConsumable(Consumable):
+    __slots__ = ("amount",)
+
     def __init__(self, amount: int):
         self.amount = amount
 
@@ -93,43 +116,51 @@ class HealingConsumable(Consumable):
 
 
 class RageConsumable(Consumable):
+    __slots__ = ("amount",)
+
     def __init__(self, amount: int):
         self.amount = amount
 
     def activate(self, action: actions.ItemAction) -> None:
-        consumer = action.entity
-        eff = RageEffect(engine= self.engine, dmg_mult=self.amount, duration=10)
-        consumer.effects.append(eff)
-        eff.parent = consumer
-        self.engine.message_log.add_message(
+        self._apply_effect(
+            action.entity,
+            RageEffect(engine=self.engine, dmg_mult=self.amount, duration=10),
             f"You are filled in with rage! (Damage increased by +1)",
-            color.damage_increased
+            color.damage_increased,
         )
-        eff.activate()
-        self.consume()
 
 
 class BlinkConsumable(Consumable):
+    __slots__ = ()
+
     def activate(self, action: actions.ItemAction) -> None:
         max_range = 5  # TODO: parametrize this (JSON, etc)
 
-        # TODO: make this more robust; e.g., ask GameMap to give you all possible free locations within max_range.
-        max_tries = 10
-        for i in range(max_tries):
-            dx, dy = random.randint(-max_range, max_range), random.randint(-max_range, max_range)
-            x = self.engine.player.x + dx
-            y = self.engine.player.y + dy
-            # TODO: check for out of bounds (x,y)
-            if (self.engine.game_map.tiles["walkable"][x, y] and
-                    self.engine.game_map.get_blocking_entity_at_location(x, y) is None):
-                self.engine.message_log.add_message("You blinked.")
-                self.engine.player.x, self.engine.player.y = x, y
-                self.consume()
-                return
-        self.engine.message_log.add_message("Mysterious force prevents you from blinking.")
+        game_map = self.engine.game_map
+        player = self.engine.player
+        # Consider every tile within max_range that is on the map and walkable,
+        # then drop the ones occupied by a blocking entity (the player included).
+        x0, y0 = max(player.x - max_range, 0), max(player.y - max_range, 0)
+        x1 = min(player.x + max_range + 1, game_map.width)
+        y1 = min(player.y + max_range + 1, game_map.height)
+        candidates = (np.argwhere(game_map.walkable[x0:x1, y0:y1]) + (x0, y0)).tolist()
+        free = [
+            (x, y) for x, y in candidates
+            if game_map.get_blocking_entity_at_location(x, y) is None
+        ]
+        if not free:
+            self.engine.message_log.add_message("Mysterious force prevents you from blinking.")
+            return
+
+        x, y = random.choice(free)
+        self.engine.message_log.add_message("You blinked.")
+        player.place(x, y)
+        self.consume()
 
 
 class FireballDamageConsumable(Consumable):
+    __slots__ = ("damage", "radius")
+
     def __init__(self, damage: int, radius: int):
         self.damage = damage
         self.radius = radius
@@ -146,17 +177,26 @@ class FireballDamageConsumable(Consumable):
 
     def activate(self, action: actions.ItemAction) -> None:
         target_xy = action.target_xy
+        engine = self.engine
+        game_map = engine.game_map
 
-        if not self.engine.game_map.visible[target_xy]:
+        if not game_map.visible[target_xy]:
             raise Impossible("You cannot target an area that you cannot see.")
 
+        # Compare squared distances so each actor costs no sqrt.
+        target_x, target_y = target_xy
+        radius_sq = self.radius * self.radius
+        damage = self.damage
+        message_log = engine.message_log
         targets_hit = False
-        for actor in self.engine.game_map.actors:
-            if actor.distance(*target_xy) <= self.radius:
-                self.engine.message_log.add_message(
-                    f"The {actor.name} is engulfed in a fiery explosion, taking {self.damage} damage!"
+        for actor in game_map.actors:
+            dx = actor.x - target_x
+            dy = actor.y - target_y
+            if dx * dx + dy * dy <= radius_sq:
+                message_log.add_message(
+                    f"The {actor.name} is engulfed in a fiery explosion, taking {damage} damage!"
                 )
-                actor.fighter.take_damage(self.damage)
+                actor.fighter.take_damage(damage)
                 targets_hit = True
 
         if not targets_hit:
@@ -165,6 +205,8 @@ class FireballDamageConsumable(Consumable):
 
 
 class LightningDamageConsumable(Consumable):
+    __slots__ = ("damage", "maximum_range")
+
     def __init__(self, damage: int, maximum_range: int):
         self.damage = damage
         self.maximum_range = maximum_range
@@ -172,15 +214,21 @@ class LightningDamageConsumable(Consumable):
     def activate(self, action: actions.ItemAction) -> None:
         consumer = action.entity
         target = None
-        closest_distance = self.maximum_range + 1.0
-
-        for actor in self.engine.game_map.actors:
-            if actor is not consumer and self.parent.gamemap.visible[actor.x, actor.y]:
-                distance = consumer.distance(actor.x, actor.y)
-
-                if distance < closest_distance:
+        # Squared distances order the same as distances and need no sqrt.
+        closest_distance_sq = (self.maximum_range + 1) ** 2
+        game_map = self.engine.game_map
+        visible = game_map.visible
+        consumer_x, consumer_y = consumer.x, consumer.y
+
+        for actor in game_map.actors:
+            if actor is not consumer and visible[actor.x, actor.y]:
+                dx = actor.x - consumer_x
+                dy = actor.y - consumer_y
+                distance_sq = dx * dx + dy * dy
+
+                if distance_sq < closest_distance_sq:
                     target = actor
-                    closest_distance = distance
+                    closest_distance_sq = distance_sq
 
         if target:
             self.engine.message_log.add_message(
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from components.base_component import BaseComponent
 
 if TYPE_CHECKING:
+    from engine import Engine
     from entity import Actor
 
 
@@ -13,17 +14,17 @@ class TimedEffect(BaseComponent):
 
     def __init__(self, engine: Engine):
         self.max_turns = 0
-        self.turns_left = 0
+        self.expires_at = 0  # First engine turn on which the effect is gone.
         self.name = "<unknown>"
 
-    def activate(self) -> None:
-        self.turns_left = self.max_turns
+    @property
+    def turns_left(self) -> int:
+        return self.expires_at - self.engine.turn
 
-    def apply_turn(self):
-        """Perform any per-turn effect."""
-        self.turns_left -= 1
-        if self.turns_left <= 0:
-            self.expire()
+    def activate(self) -> None:
+        engine = self.engine
+        self.expires_at = engine.turn + self.max_turns
+        engine.schedule_expiry(self)
 
     def expire(self):
         """Action to perform once effect wears off."""
@@ -15,30 +15,23 @@ class Equipment(BaseComponent):
     def __init__(self, weapon: Optional[Item] = None, armor: Optional[Item] = None):
         self.weapon = weapon
         self.armor = armor
+        # Totals of the equipped items' bonuses.  They are read on every
+        # attack, so they are recomputed only when a slot changes.
+        self.defense_bonus = 0
+        self.power_bonus = 0
+        self.update_bonuses()
 
-    @property
-    def defense_bonus(self) -> int:
-        bonus = 0
+    def update_bonuses(self) -> None:
+        """Recompute `defense_bonus` and `power_bonus`; call whenever a slot changes."""
+        defense_bonus = power_bonus = 0
 
-        if self.weapon is not None and self.weapon.equippable is not None:
-            bonus += self.weapon.equippable.defense_bonus
+        for item in (self.weapon, self.armor):
+            if item is not None and item.equippable is not None:
+                defense_bonus += item.equippable.defense_bonus
+                power_bonus += item.equippable.power_bonus
 
-        if self.armor is not None and self.armor.equippable is not None:
-            bonus += self.armor.equippable.defense_bonus
-
-        return bonus
-
-    @property
-    def power_bonus(self) -> int:
-        bonus = 0
-
-        if self.weapon is not None and self.weapon.equippable is not None:
-            bonus += self.weapon.equippable.power_bonus
-
-        if self.armor is not None and self.armor.equippable is not None:
-            bonus += self.armor.equippable.power_bonus
-
-        return bonus
+        self.defense_bonus = defense_bonus
+        self.power_bonus = power_bonus
 
     def item_is_equipped(self, item: Item) -> bool:
         return self.weapon == item or self.armor == item
@@ -68,6 +61,7 @@ class Equipment(BaseComponent):
             self.unequip_from_slot(slot, add_message)
 
         setattr(self, slot, item)
+        self.update_bonuses()
 
         if add_message:
             self.equip_message(item.name)
@@ -79,6 +73,7 @@ class Equipment(BaseComponent):
             self.unequip_message(current_item.name)
 
         setattr(self, slot, None)
+        self.update_bonuses()
 
     def toggle_equip(self, equippable_item: Item, add_message: bool = True) -> None:
         if (
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import color, random
+from random import randrange as _randrange
+
+import color
 from components.base_component import BaseComponent
 from render_order import RenderOrder
 
@@ -13,11 +15,12 @@ if TYPE_CHECKING:
 class Fighter(BaseComponent):
     parent: Actor
 
-    def __init__(self, hp: int, base_defense: int, base_power: int):
+    def __init__(self, hp: int, base_defense: int, base_power: int, crit_chance: float = 0.05):
         self.max_hp = hp
         self._hp = hp
         self.base_defense = base_defense
         self.base_power = base_power
+        self.crit_chance = crit_chance
 
     @property
     def hp(self) -> int:
@@ -57,10 +60,10 @@ class Fighter(BaseComponent):
             "impaled", "blown to smithereens", "sliced down", "beat to death", "butchered"
         ]
         if self.engine.player is self.parent:
-            death_message = f"You were {deathmessagelist[random.randint(0, 3)]}. You are dead."
+            death_message = f"You were {deathmessagelist[_randrange(len(deathmessagelist))]}. You are dead."
             death_message_color = color.player_die
         else:
-            death_message = f"{self.parent.name} was {deathmessagelist[random.randint(0, 3)]}!"
+            death_message = f"{self.parent.name} was {deathmessagelist[_randrange(len(deathmessagelist))]}!"
             death_message_color = color.enemy_die
 
         self.parent.char = "%"
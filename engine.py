@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import copy
+import heapq
 import lzma
 import pickle
-from typing import TYPE_CHECKING
+from typing import List, Tuple, TYPE_CHECKING
 
 from tcod.console import Console
 from tcod.map import compute_fov
@@ -15,6 +16,7 @@ from message_log import MessageLog
 import render_functions
 
 if TYPE_CHECKING:
+    from components.effect import TimedEffect
     from entity import Actor
     from game_map import GameMap, GameWorld
 
@@ -30,6 +32,9 @@ class Engine:
         self.monster_manager = MonsterManager("data/monsters.json", self.item_manager)
         self.player = self.monster_manager.clone('player')
         self.turn = 1
+        # Active timed effects as (expires_at, sequence, effect), soonest first.
+        self.effect_heap: List[Tuple[int, int, TimedEffect]] = []
+        self.effect_sequence = 0  # Tie-breaker, so effects are never compared.
 
     def handle_enemy_turns(self) -> None:
         for entity in set(self.game_map.actors) - {self.player}:
@@ -48,6 +53,7 @@ class Engine:
         )
         # If a tile is "visible" it should be added to "explored".
         self.game_map.explored |= self.game_map.visible
+        self.game_map.update_monsters_visible()
 
     def render(self, console: Console) -> None:
         self.game_map.render(console)
@@ -97,10 +103,17 @@ class Engine:
         with open(filename, "wb") as f:
             f.write(save_data)
 
+    def schedule_expiry(self, effect: TimedEffect) -> None:
+        """Queue `effect` to expire just before the engine reaches turn `effect.expires_at`."""
+        self.effect_sequence += 1
+        heapq.heappush(self.effect_heap, (effect.expires_at, self.effect_sequence, effect))
+
     def apply_timed_effects(self):
-        for entity in set(self.game_map.actors):
-            for eff in entity.effects:
-                eff.apply_turn()
+        # Runs before self.turn is advanced, so expire whatever is gone by the
+        # next turn.  Only those effects are touched, not every active one.
+        heap = self.effect_heap
+        while heap and heap[0][0] <= self.turn + 1:
+            heapq.heappop(heap)[2].expire()
 
     def end_turn(self):
         self.apply_timed_effects()
@@ -79,7 +79,7 @@ class Entity:
         if parent:
             # If parent isn't provided now then it will be set later.
             self.parent = parent
-            parent.entities.add(self)
+            parent.add_entity(self)
         else:
             self.parent = None
 
@@ -95,19 +95,21 @@ class Entity:
         clone.x = x
         clone.y = y
         clone.parent = gamemap
-        gamemap.entities.add(clone)
+        gamemap.add_entity(clone)
         return clone
 
     def place(self, x: int, y: int, gamemap: Optional[GameMap] = None) -> None:
         """Place this entitiy at a new location.  Handles moving across GameMaps."""
-        self.x = x
-        self.y = y
         if gamemap:
             if hasattr(self, "parent"):  # Possibly uninitialized.
                 if self.parent is not None and self.parent is self.gamemap:
-                    self.gamemap.entities.remove(self)
+                    self.gamemap.remove_entity(self)
+            self.x = x
+            self.y = y
             self.parent = gamemap
-            gamemap.entities.add(self)
+            gamemap.add_entity(self)
+        else:
+            self.move(x - self.x, y - self.y)
 
     def distance(self, x: int, y: int) -> float:
         """
@@ -117,15 +119,19 @@ class Entity:
 
     def move(self, dx: int, dy: int) -> None:
         # Move the entity by a given amount
-        self.x += dx
-        self.y += dy
+        if self.parent is not None and self.parent is self.gamemap:
+            # On a map: keep its location index in sync.
+            self.parent.move_entity(self, self.x + dx, self.y + dy)
+        else:
+            self.x += dx
+            self.y += dy
 
     def get_path_to(self, dest_x: int, dest_y: int) -> List[Tuple[int, int]]:
         """Compute and return a path to the target position.
         If there is no valid path then returns an empty list.
         """
         # Copy the walkable array.
-        cost = np.array(self.gamemap.tiles["walkable"], dtype=np.int8)
+        cost = np.array(self.gamemap.walkable, dtype=np.int8)
 
         for entity in self.gamemap.entities:
             # Check that an entity blocks movement and the cost isn't zero (blocking.)
@@ -200,6 +206,9 @@ class Actor(Entity):
 
         self.noticed_player = False
 
+        # Capitalized name for the start of combat messages.
+        self.display_name = name.capitalize()
+
     @property
     def is_alive(self) -> bool:
         """Returns True as long as this actor can perform actions."""
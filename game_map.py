@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable, Iterator, Optional, TYPE_CHECKING
+from typing import AbstractSet, Dict, Iterable, Iterator, Optional, Set, Tuple, TYPE_CHECKING
 
 import numpy as np  # type: ignore
 from tcod.console import Console
@@ -19,8 +19,17 @@ class GameMap:
     ):
         self.engine = engine
         self.width, self.height = width, height
-        self.entities = set(entities)
+        self.entities: Set[Entity] = set()
+        # Spatial hash of the entities above, keyed by (x, y).
+        self.entities_by_xy: Dict[Tuple[int, int], Set[Entity]] = {}
+        # The Actor subset of `entities`, so scans for actors skip items.
+        self._actors: Set[Actor] = set()
+        for entity in entities:
+            self.add_entity(entity)
         self.tiles = np.full((width, height), fill_value=tile_types.wall, order="F")
+        # Plain bool view of the "walkable" field.  It shares memory with
+        # `tiles`, so tile writes are reflected here without extra bookkeeping.
+        self.walkable = self.tiles["walkable"]
 
         self.visible = np.full(
             (width, height), fill_value=False, order="F"
@@ -29,6 +38,18 @@ class GameMap:
             (width, height), fill_value=False, order="F"
         )  # Tiles the player has seen before
         self.downstairs_location = (0, 0)
+        # Cached result for any_monsters_visible(), refreshed with the FOV.
+        self._monsters_visible = False
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # Pickling would turn the view into a detached copy; rebuild it on load.
+        del state["walkable"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.walkable = self.tiles["walkable"]
 
     @property
     def gamemap(self) -> GameMap:
@@ -37,41 +58,73 @@ class GameMap:
     @property
     def actors(self) -> Iterator[Actor]:
         """Iterate over this maps living actors."""
-        yield from (
-            entity
-            for entity in self.entities
-            if isinstance(entity, Actor) and entity.is_alive
-        )
+        yield from (actor for actor in self._actors if actor.is_alive)
 
     @property
     def items(self) -> Iterator[Item]:
         yield from (entity for entity in self.entities if isinstance(entity, Item))
 
-    def any_monsters_visible(self):
-        for a in self.actors:
-            if a == self.engine.player:
-                continue
-            if self.visible[a.x, a.y]:
-                return True
-        return False
+    def add_entity(self, entity: Entity) -> None:
+        """Add an entity to this map, indexing it by its current location."""
+        self.entities.add(entity)
+        if isinstance(entity, Actor):
+            self._actors.add(entity)
+        self.entities_by_xy.setdefault((entity.x, entity.y), set()).add(entity)
+
+    def remove_entity(self, entity: Entity) -> None:
+        """Remove an entity from this map and from the location index."""
+        self.entities.remove(entity)
+        self._actors.discard(entity)
+        self._unindex(entity)
+
+    def move_entity(self, entity: Entity, x: int, y: int) -> None:
+        """Move an entity already on this map to (x, y), keeping the index in sync."""
+        self._unindex(entity)
+        entity.x, entity.y = x, y
+        self.entities_by_xy.setdefault((x, y), set()).add(entity)
+
+    def _unindex(self, entity: Entity) -> None:
+        key = entity.x, entity.y
+        bucket = self.entities_by_xy[key]
+        bucket.discard(entity)
+        if not bucket:
+            del self.entities_by_xy[key]
+
+    def get_entities_at_location(self, x: int, y: int) -> AbstractSet[Entity]:
+        """Return the entities at (x, y).  Do not modify the returned set."""
+        return self.entities_by_xy.get((x, y), frozenset())
+
+    def get_items_at_location(self, x: int, y: int) -> Iterator[Item]:
+        yield from (
+            entity
+            for entity in self.get_entities_at_location(x, y)
+            if isinstance(entity, Item)
+        )
+
+    def update_monsters_visible(self) -> None:
+        """Recompute whether any monster is in view; call whenever `visible` changes."""
+        player = self.engine.player
+        self._monsters_visible = any(
+            a is not player and self.visible[a.x, a.y] for a in self.actors
+        )
+
+    def any_monsters_visible(self) -> bool:
+        """Return True if a monster was in view at the last FOV update."""
+        return self._monsters_visible
 
     def get_blocking_entity_at_location(
         self, location_x: int, location_y: int,
     ) -> Optional[Entity]:
-        for entity in self.entities:
-            if (
-                entity.blocks_movement
-                and entity.x == location_x
-                and entity.y == location_y
-            ):
+        for entity in self.get_entities_at_location(location_x, location_y):
+            if entity.blocks_movement:
                 return entity
 
         return None
 
     def get_actor_at_location(self, x: int, y: int) -> Optional[Actor]:
-        for actor in self.actors:
-            if actor.x == x and actor.y == y:
-                return actor
+        for entity in self.get_entities_at_location(x, y):
+            if isinstance(entity, Actor) and entity.is_alive:
+                return entity
 
         return None
 